@@ -69,6 +69,12 @@ from .language import (
     parse_type,
     # Print
     print_ast,
+    print_ast_compact,
+    print_ast_into,
+    print_ast_cached,
+    clear_print_cache,
+    hash_ast,
+    print_source,
     # Visit
     visit,
     ParallelVisitor,
@@ -615,6 +621,12 @@ __all__ = [
     "parse_const_value",
     "parse_type",
     "print_ast",
+    "print_ast_compact",
+    "print_ast_into",
+    "print_ast_cached",
+    "clear_print_cache",
+    "hash_ast",
+    "print_source",
     "visit",
     "ParallelVisitor",
     "TypeInfoVisitor",
@@ -16,7 +16,15 @@ from .lexer import Lexer
 
 from .parser import parse, parse_type, parse_value, parse_const_value
 
-from .printer import print_ast
+from .printer import (
+    print_ast,
+    print_ast_compact,
+    print_ast_into,
+    print_ast_cached,
+    clear_print_cache,
+    hash_ast,
+    print_source,
+)
 
 from .visitor import (
     visit,
@@ -127,6 +135,12 @@ __all__ = [
     "parse_const_value",
     "parse_type",
     "print_ast",
+    "print_ast_compact",
+    "print_ast_into",
+    "print_ast_cached",
+    "clear_print_cache",
+    "hash_ast",
+    "print_source",
     "Source",
     "visit",
     "Visitor",
@@ -341,7 +341,7 @@ QUERY_DOCUMENT_KEYS: Dict[str, Tuple[str, ...]] = {
 class Node:
     """AST nodes"""
 
-    # allow custom attributes and weak references (not used internally)
+    # allow custom attributes and weak references (used by print_ast_cached)
     __slots__ = "__dict__", "__weakref__", "loc", "_hash"
 
     loc: Optional[Location]
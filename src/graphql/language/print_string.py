@@ -1,3 +1,6 @@
+import re
+
+
 __all__ = ["print_string"]
 
 
@@ -9,7 +12,8 @@ def print_string(s: str) -> str:
     """
     if not isinstance(s, str):
         s = str(s)
-    return f'"{s.translate(escape_sequences)}"'
+    # most strings do not need to be escaped, which can be checked much faster
+    return f'"{s.translate(escape_sequences)}"' if needs_escape(s) else f'"{s}"'
 
 
 escape_sequences = {
@@ -81,3 +85,5 @@ escape_sequences = {
     0x9E: "\\u009E",
     0x9F: "\\u009F",
 }
+
+needs_escape = re.compile(r'[\x00-\x1f"\\\x7f-\x9f]').search
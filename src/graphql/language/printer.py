@@ -1,9 +1,63 @@
-from typing import Any, Collection, Optional
-
-from ..language.ast import Node, OperationType
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import RLock
+from typing import Any, Callable, Collection, Dict, List, Optional, Tuple, Union
+from weakref import ref
+
+from ..pyutils import inspect
+from .ast import (
+    ArgumentNode,
+    BooleanValueNode,
+    DirectiveDefinitionNode,
+    DirectiveNode,
+    DocumentNode,
+    EnumTypeDefinitionNode,
+    EnumTypeExtensionNode,
+    EnumValueDefinitionNode,
+    EnumValueNode,
+    ErrorBoundaryNode,
+    FieldDefinitionNode,
+    FieldNode,
+    FloatValueNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    InputObjectTypeDefinitionNode,
+    InputObjectTypeExtensionNode,
+    InputValueDefinitionNode,
+    InterfaceTypeDefinitionNode,
+    InterfaceTypeExtensionNode,
+    IntValueNode,
+    ListNullabilityOperatorNode,
+    ListTypeNode,
+    ListValueNode,
+    NamedTypeNode,
+    NameNode,
+    Node,
+    NonNullAssertionNode,
+    NonNullTypeNode,
+    NullValueNode,
+    ObjectFieldNode,
+    ObjectTypeDefinitionNode,
+    ObjectTypeExtensionNode,
+    ObjectValueNode,
+    OperationDefinitionNode,
+    OperationType,
+    OperationTypeDefinitionNode,
+    ScalarTypeDefinitionNode,
+    ScalarTypeExtensionNode,
+    SchemaDefinitionNode,
+    SchemaExtensionNode,
+    SelectionSetNode,
+    StringValueNode,
+    UnionTypeDefinitionNode,
+    UnionTypeExtensionNode,
+    VariableDefinitionNode,
+    VariableNode,
+)
 from .block_string import print_block_string
 from .print_string import print_string
-from .visitor import Visitor, visit
+from .visitor import Visitor
 
 
 try:
@@ -12,11 +66,21 @@ except ImportError:  # Python < 3.10
     from typing_extensions import TypeAlias
 
 
-__all__ = ["print_ast"]
+__all__ = [
+    "print_ast",
+    "print_ast_compact",
+    "print_ast_into",
+    "print_ast_cached",
+    "clear_print_cache",
+    "hash_ast",
+    "print_source",
+]
 
 
 MAX_LINE_LENGTH = 80
 
+MAX_CACHED_DOCUMENTS = 1000
+
 Strings: TypeAlias = Collection[str]
 
 
@@ -54,10 +118,811 @@ def print_ast(ast: Node) -> str:
 
     The conversion is done using a set of reasonable formatting rules.
     """
-    return visit(ast, PrintAstVisitor())
+    if not isinstance(ast, Node):
+        raise TypeError(f"Not an AST Node: {inspect(ast)}.")
+    out: List[str] = []
+    _print_node(ast, out, "\n")
+    return "".join(out)
+
+
+def print_ast_into(ast: Node, out: List[str]) -> None:
+    """Convert an AST into a string by appending to the given list of strings.
+
+    The AST is printed like with :func:`print_ast`, but instead of returning the
+    result, its fragments are appended to the given list. This is useful when the
+    printed AST will be written to a stream or combined with other strings anyway,
+    since it avoids creating an intermediate string for each printed AST.
+    """
+    if not isinstance(ast, Node):
+        raise TypeError(f"Not an AST Node: {inspect(ast)}.")
+    _print_node(ast, out, "\n")
+
+
+def print_ast_compact(ast: Node) -> str:
+    """Convert an AST into a compact string on a single line.
+
+    Blocks are printed as ``{ a b c }``, arguments are never put on separate lines,
+    and block strings and descriptions are printed as regular strings.
+
+    This is recommended when the output should fit on a single line or is not meant
+    to be read by humans, e.g. for logging, tracing or creating cache keys.
+    """
+    if not isinstance(ast, Node):
+        raise TypeError(f"Not an AST Node: {inspect(ast)}.")
+    out: List[str] = []
+    _print_node(ast, out, _COMPACT_NL)
+    return "".join(out)
+
+
+def hash_ast(ast: Node) -> bytes:
+    """Get a digest of an AST that can be used as a cache key.
+
+    The digest is a 16 byte BLAKE2 hash of the compactly printed AST. Therefore, it is
+    the same for ASTs that differ only in the formatting of their source, in their
+    locations, or in using block strings instead of regular strings with the same
+    value.
+    """
+    return blake2b(print_ast_compact(ast).encode(), digest_size=16).digest()
+
+
+def print_source(ast: Node) -> str:
+    """Get the source text of a parsed AST.
+
+    If the AST has location information, the part of the source document it was
+    parsed from is returned unchanged, including its original formatting and any
+    comments, which is much faster than printing the AST. Otherwise, the AST is
+    printed using :func:`print_ast`.
+
+    Note that modifications of the AST are not reflected in the source text. Nodes
+    that have been modified or copied with :func:`~graphql.language.visit` keep the
+    location of the original node, so use :func:`print_ast` for such ASTs.
+    """
+    if not isinstance(ast, Node):
+        raise TypeError(f"Not an AST Node: {inspect(ast)}.")
+    loc = ast.loc
+    if loc is None:
+        return print_ast(ast)
+    return loc.source.body[loc.start : loc.end]
+
+
+def print_ast_cached(ast: Node) -> str:
+    """Convert an AST into a string, caching printed documents.
+
+    The AST is printed like with :func:`print_ast`, but printed documents are cached
+    for as long as the document is alive, so that printing the same document
+    repeatedly is cheap. Since the cache is keyed by the identity of the document,
+    a document must not be modified in place after it has been printed with this
+    function. Nodes that are not documents are printed without caching.
+    """
+    if not isinstance(ast, Node):
+        raise TypeError(f"Not an AST Node: {inspect(ast)}.")
+    if isinstance(ast, DocumentNode):
+        return _print_document(ast)
+    out: List[str] = []
+    _print_node(ast, out, "\n")
+    return "".join(out)
+
+
+def clear_print_cache() -> None:
+    """Clear the cache of printed documents used by :func:`print_ast_cached`."""
+    with _print_cache_lock:
+        _print_cache.clear()
+
+
+# Cache of printed documents, mapping the ids of documents to pairs of a weak
+# reference to the document and the printed document, in least recently used order.
+_print_cache: "OrderedDict[int, Tuple[ref[DocumentNode], str]]" = OrderedDict()
+# Reentrant, since garbage collection may remove entries while the lock is held.
+_print_cache_lock = RLock()
+
+
+def _print_document(document: DocumentNode) -> str:
+    """Print the given document, using the cache of printed documents."""
+    cache, lock = _print_cache, _print_cache_lock
+    key = id(document)
+    with lock:
+        entry = cache.get(key)
+        if entry is not None and entry[0]() is document:
+            cache.move_to_end(key)
+            return entry[1]
+    out: List[str] = []
+    _print_node(document, out, "\n")
+    printed = "".join(out)
+
+    def remove(_document_ref: "ref[DocumentNode]") -> None:
+        with lock:
+            cache.pop(key, None)
+
+    with lock:
+        if key not in cache and len(cache) >= MAX_CACHED_DOCUMENTS:
+            cache.popitem(last=False)
+        cache[key] = ref(document, remove), printed
+    return printed
+
+
+# The printer functions append the fragments of the printed node to the output
+# buffer. The line break to be used (including the indentation of the current
+# nesting level) is passed down as the last argument. When printing compactly,
+# a single space is passed down instead.
+
+_COMPACT_NL = " "
+
+
+class _IndentedLineBreaks(Dict[str, str]):
+    """Mapping from line breaks to the line breaks of the next nesting level.
+
+    This makes sure that the line breaks are only created once and then shared.
+    """
+
+    def __missing__(self, nl: str) -> str:
+        indented_nl = self[nl] = nl + "  "
+        return indented_nl
+
+
+_INDENTED_NL = _IndentedLineBreaks({_COMPACT_NL: _COMPACT_NL})
+
+_OP_QUERY = OperationType.QUERY
+_OP_VALUES: Dict[OperationType, str] = {
+    operation: operation.value for operation in OperationType
+}
+
+Printer: TypeAlias = Callable[[Any, List[str], str], None]
+
+
+def _print_node(node: Node, out: List[str], nl: str) -> None:
+    """Print the given node by appending its fragments to the output buffer."""
+    try:
+        printer = _PRINTERS[node.kind]
+    except (AttributeError, KeyError):
+        raise TypeError(f"Invalid AST Node: {inspect(node)}.") from None
+    printer(node, out, nl)
+
+
+def _p_name(node: NameNode, out: List[str], _nl: str) -> None:
+    value = node.value
+    if value:
+        out.append(value)
+
+
+def _p_variable(node: VariableNode, out: List[str], nl: str) -> None:
+    out.append("$")
+    _print_node(node.name, out, nl)
+
+
+# Document
+
+
+def _p_document(node: DocumentNode, out: List[str], nl: str) -> None:
+    _join(out, node.definitions, nl, nl if nl == _COMPACT_NL else "\n\n")
+
+
+def _p_operation_definition(
+    node: OperationDefinitionNode, out: List[str], nl: str
+) -> None:
+    name, var_defs, directives = node.name, node.variable_definitions, node.directives
+    if name and not name.value:
+        name = None
+    operation = node.operation
+    # Anonymous queries with no directives or variable definitions can use the
+    # query short form.
+    if name or var_defs or directives or operation is not _OP_QUERY:
+        append = out.append
+        append(_OP_VALUES[operation])
+        if name or var_defs:
+            append(" ")
+            _wrap(out, "", name, nl)
+            _join(out, var_defs, nl, ", ", "(", ")")
+        _join(out, directives, nl, " ", " ")
+        append(" ")
+    _print_node(node.selection_set, out, nl)
+
+
+def _p_variable_definition(
+    node: VariableDefinitionNode, out: List[str], nl: str
+) -> None:
+    _print_node(node.variable, out, nl)
+    out.append(": ")
+    _print_node(node.type, out, nl)
+    _wrap(out, " = ", node.default_value, nl)
+    _join(out, node.directives, nl, " ", " ")
+
+
+def _p_selection_set(node: SelectionSetNode, out: List[str], nl: str) -> None:
+    _block(out, node.selections, nl)
+
+
+def _p_field(node: FieldNode, out: List[str], nl: str) -> None:
+    print_node = _print_node
+    start = len(out)
+    alias = node.alias
+    if alias:
+        print_node(alias, out, nl)
+        out.append(": ")
+    print_node(node.name, out, nl)
+    args = node.arguments
+    if args:
+        args_start = len(out)
+        _join(out, args, nl, ", ", "(", ")")
+        if nl != _COMPACT_NL:
+            line = "".join(out[start:])
+            # the line length does not include the indentation of multiline strings
+            if len(line) - line.count("\n") * (len(nl) - 1) > MAX_LINE_LENGTH:
+                del out[args_start:]
+                _block(out, args, nl, "(", ")")
+    #  Note: Client Controlled Nullability is experimental and may be
+    #  changed or removed in the future.
+    nullability_assertion = node.nullability_assertion
+    if nullability_assertion:
+        print_node(nullability_assertion, out, nl)
+    directives = node.directives
+    if directives:
+        _join(out, directives, nl, " ", " ")
+    selection_set = node.selection_set
+    if selection_set:
+        _wrap(out, " ", selection_set, nl)
+
+
+def _p_name_value_pair(
+    node: Union[ArgumentNode, ObjectFieldNode], out: List[str], nl: str
+) -> None:
+    print_node = _print_node
+    print_node(node.name, out, nl)
+    out.append(": ")
+    print_node(node.value, out, nl)
+
+
+# Nullability Modifiers
+
+
+def _p_list_nullability_operator(
+    node: ListNullabilityOperatorNode, out: List[str], nl: str
+) -> None:
+    out.append("[")
+    _wrap(out, "", node.nullability_assertion, nl)
+    out.append("]")
+
+
+def _p_non_null_assertion(node: NonNullAssertionNode, out: List[str], nl: str) -> None:
+    _wrap(out, "", node.nullability_assertion, nl)
+    out.append("!")
+
+
+def _p_error_boundary(node: ErrorBoundaryNode, out: List[str], nl: str) -> None:
+    _wrap(out, "", node.nullability_assertion, nl)
+    out.append("?")
+
+
+# Fragments
+
+
+def _p_fragment_spread(node: FragmentSpreadNode, out: List[str], nl: str) -> None:
+    out.append("...")
+    _print_node(node.name, out, nl)
+    _join(out, node.directives, nl, " ", " ")
+
+
+def _p_inline_fragment(node: InlineFragmentNode, out: List[str], nl: str) -> None:
+    out.append("...")
+    _wrap(out, " on ", node.type_condition, nl)
+    _join(out, node.directives, nl, " ", " ")
+    _wrap(out, " ", node.selection_set, nl)
+
+
+def _p_fragment_definition(
+    node: FragmentDefinitionNode, out: List[str], nl: str
+) -> None:
+    # Note: fragment variable definitions are deprecated and will be removed in v3.3
+    out.append("fragment ")
+    _print_node(node.name, out, nl)
+    _join(out, node.variable_definitions, nl, ", ", "(", ")")
+    out.append(" on ")
+    _print_node(node.type_condition, out, nl)
+    _join(out, node.directives, nl, " ", " ")
+    out.append(" ")
+    _print_node(node.selection_set, out, nl)
+
+
+# Value
+
+
+def _p_raw_value(
+    node: Union[IntValueNode, FloatValueNode, EnumValueNode], out: List[str], _nl: str
+) -> None:
+    out.append(node.value)
+
+
+def _p_string_value(node: StringValueNode, out: List[str], nl: str) -> None:
+    if node.block and nl != _COMPACT_NL:
+        _indent_into(out, print_block_string(node.value), nl)
+    else:
+        out.append(print_string(node.value))
+
+
+def _p_boolean_value(node: BooleanValueNode, out: List[str], _nl: str) -> None:
+    out.append("true" if node.value else "false")
+
+
+def _p_null_value(_node: NullValueNode, out: List[str], _nl: str) -> None:
+    out.append("null")
+
+
+def _p_list_value(node: ListValueNode, out: List[str], nl: str) -> None:
+    out.append("[")
+    _join(out, node.values, nl, ", ")
+    out.append("]")
+
+
+def _p_object_value(node: ObjectValueNode, out: List[str], nl: str) -> None:
+    out.append("{ ")
+    _join(out, node.fields, nl, ", ")
+    out.append(" }")
+
+
+# Directive
+
+
+def _p_directive(node: DirectiveNode, out: List[str], nl: str) -> None:
+    out.append("@")
+    _print_node(node.name, out, nl)
+    _join(out, node.arguments, nl, ", ", "(", ")")
+
+
+# Type
+
+
+def _p_named_type(node: NamedTypeNode, out: List[str], nl: str) -> None:
+    _print_node(node.name, out, nl)
+
+
+def _p_list_type(node: ListTypeNode, out: List[str], nl: str) -> None:
+    out.append("[")
+    _print_node(node.type, out, nl)
+    out.append("]")
+
+
+def _p_non_null_type(node: NonNullTypeNode, out: List[str], nl: str) -> None:
+    _print_node(node.type, out, nl)
+    out.append("!")
+
+
+# Type System Definitions
+
+
+def _p_schema_definition(node: SchemaDefinitionNode, out: List[str], nl: str) -> None:
+    description = node.description
+    if description:
+        _print_node(description, out, nl)
+        out.append(nl)
+    out.append("schema")
+    _join(out, node.directives, nl, " ", " ")
+    _wrap_block(out, node.operation_types, nl)
+
+
+def _p_operation_type_definition(
+    node: OperationTypeDefinitionNode, out: List[str], nl: str
+) -> None:
+    out.append(_OP_VALUES[node.operation])
+    out.append(": ")
+    _print_node(node.type, out, nl)
+
+
+def _p_scalar_type_definition(
+    node: ScalarTypeDefinitionNode, out: List[str], nl: str
+) -> None:
+    description = node.description
+    if description:
+        _print_node(description, out, nl)
+        out.append(nl)
+    out.append("scalar ")
+    _print_node(node.name, out, nl)
+    _join(out, node.directives, nl, " ", " ")
+
+
+def _p_object_type_definition(
+    node: ObjectTypeDefinitionNode, out: List[str], nl: str
+) -> None:
+    description = node.description
+    if description:
+        _print_node(description, out, nl)
+        out.append(nl)
+    _print_object_type(node, out, nl, "type ")
+
+
+def _p_field_definition(node: FieldDefinitionNode, out: List[str], nl: str) -> None:
+    print_node = _print_node
+    description = node.description
+    if description:
+        print_node(description, out, nl)
+        out.append(nl)
+    print_node(node.name, out, nl)
+    arguments = node.arguments
+    if arguments:
+        _print_arguments_definition(out, arguments, nl)
+    out.append(": ")
+    print_node(node.type, out, nl)
+    directives = node.directives
+    if directives:
+        _join(out, directives, nl, " ", " ")
+
+
+def _p_input_value_definition(
+    node: InputValueDefinitionNode, out: List[str], nl: str
+) -> None:
+    print_node = _print_node
+    description = node.description
+    if description:
+        print_node(description, out, nl)
+        out.append(nl)
+    print_node(node.name, out, nl)
+    out.append(": ")
+    print_node(node.type, out, nl)
+    default_value = node.default_value
+    if default_value:
+        _wrap(out, " = ", default_value, nl)
+    directives = node.directives
+    if directives:
+        _join(out, directives, nl, " ", " ")
+
+
+def _p_interface_type_definition(
+    node: InterfaceTypeDefinitionNode, out: List[str], nl: str
+) -> None:
+    description = node.description
+    if description:
+        _print_node(description, out, nl)
+        out.append(nl)
+    _print_object_type(node, out, nl, "interface ")
+
+
+def _p_union_type_definition(
+    node: UnionTypeDefinitionNode, out: List[str], nl: str
+) -> None:
+    description = node.description
+    if description:
+        _print_node(description, out, nl)
+        out.append(nl)
+    _print_union_type(node, out, nl, "union ")
+
+
+def _p_enum_type_definition(
+    node: EnumTypeDefinitionNode, out: List[str], nl: str
+) -> None:
+    description = node.description
+    if description:
+        _print_node(description, out, nl)
+        out.append(nl)
+    _print_block_type(node, out, nl, "enum ", node.values)
+
+
+def _p_enum_value_definition(
+    node: EnumValueDefinitionNode, out: List[str], nl: str
+) -> None:
+    description = node.description
+    if description:
+        _print_node(description, out, nl)
+        out.append(nl)
+    _print_node(node.name, out, nl)
+    _join(out, node.directives, nl, " ", " ")
+
+
+def _p_input_object_type_definition(
+    node: InputObjectTypeDefinitionNode, out: List[str], nl: str
+) -> None:
+    description = node.description
+    if description:
+        _print_node(description, out, nl)
+        out.append(nl)
+    _print_block_type(node, out, nl, "input ", node.fields)
+
+
+def _p_directive_definition(
+    node: DirectiveDefinitionNode, out: List[str], nl: str
+) -> None:
+    description = node.description
+    if description:
+        _print_node(description, out, nl)
+        out.append(nl)
+    out.append("directive @")
+    _print_node(node.name, out, nl)
+    arguments = node.arguments
+    if arguments:
+        _print_arguments_definition(out, arguments, nl)
+    if node.repeatable:
+        out.append(" repeatable")
+    out.append(" on ")
+    _join(out, node.locations, nl, " | ")
+
+
+def _p_schema_extension(node: SchemaExtensionNode, out: List[str], nl: str) -> None:
+    out.append("extend schema")
+    _join(out, node.directives, nl, " ", " ")
+    _wrap_block(out, node.operation_types, nl)
+
+
+def _p_scalar_type_extension(
+    node: ScalarTypeExtensionNode, out: List[str], nl: str
+) -> None:
+    out.append("extend scalar ")
+    _print_node(node.name, out, nl)
+    _join(out, node.directives, nl, " ", " ")
+
+
+def _p_object_type_extension(
+    node: ObjectTypeExtensionNode, out: List[str], nl: str
+) -> None:
+    _print_object_type(node, out, nl, "extend type ")
+
+
+def _p_interface_type_extension(
+    node: InterfaceTypeExtensionNode, out: List[str], nl: str
+) -> None:
+    _print_object_type(node, out, nl, "extend interface ")
+
+
+def _p_union_type_extension(
+    node: UnionTypeExtensionNode, out: List[str], nl: str
+) -> None:
+    _print_union_type(node, out, nl, "extend union ")
+
+
+def _p_enum_type_extension(
+    node: EnumTypeExtensionNode, out: List[str], nl: str
+) -> None:
+    _print_block_type(node, out, nl, "extend enum ", node.values)
+
+
+def _p_input_object_type_extension(
+    node: InputObjectTypeExtensionNode, out: List[str], nl: str
+) -> None:
+    _print_block_type(node, out, nl, "extend input ", node.fields)
+
+
+def _print_object_type(
+    node: Union[
+        ObjectTypeDefinitionNode,
+        ObjectTypeExtensionNode,
+        InterfaceTypeDefinitionNode,
+        InterfaceTypeExtensionNode,
+    ],
+    out: List[str],
+    nl: str,
+    keyword: str,
+) -> None:
+    """Print an object or interface type definition or extension."""
+    out.append(keyword)
+    _print_node(node.name, out, nl)
+    _join(out, node.interfaces, nl, " & ", " implements ")
+    _join(out, node.directives, nl, " ", " ")
+    _wrap_block(out, node.fields, nl)
+
+
+def _print_union_type(
+    node: Union[UnionTypeDefinitionNode, UnionTypeExtensionNode],
+    out: List[str],
+    nl: str,
+    keyword: str,
+) -> None:
+    """Print a union type definition or extension."""
+    out.append(keyword)
+    _print_node(node.name, out, nl)
+    _join(out, node.directives, nl, " ", " ")
+    _join(out, node.types, nl, " | ", " = ")
+
+
+def _print_block_type(
+    node: Union[
+        EnumTypeDefinitionNode,
+        EnumTypeExtensionNode,
+        InputObjectTypeDefinitionNode,
+        InputObjectTypeExtensionNode,
+    ],
+    out: List[str],
+    nl: str,
+    keyword: str,
+    items: Optional[Collection[Node]],
+) -> None:
+    """Print an enum or input object type definition or extension."""
+    out.append(keyword)
+    _print_node(node.name, out, nl)
+    _join(out, node.directives, nl, " ", " ")
+    _wrap_block(out, items, nl)
+
+
+def _print_arguments_definition(
+    out: List[str], args: Collection[InputValueDefinitionNode], nl: str
+) -> None:
+    """Print the arguments of a field or directive definition.
+
+    The arguments are put on separate lines if one of them spans multiple lines,
+    i.e. if it has a description or contains a multiline block string.
+    """
+    if nl != _COMPACT_NL and any(
+        arg.description or _is_multiline_input_value(arg) for arg in args
+    ):
+        _block(out, args, nl, "(", ")")
+    else:
+        _join(out, args, nl, ", ", "(", ")")
+
+
+def _is_multiline_input_value(node: InputValueDefinitionNode) -> bool:
+    """Check whether an input value contains a multiline block string.
+
+    Only the default value and the directives need to be checked, since the
+    description is checked separately and types cannot contain strings.
+    """
+    default_value, directives = node.default_value, node.directives
+    return bool(
+        (default_value and _is_multiline_value(default_value))
+        or (directives and any(map(_is_multiline_value, directives)))
+    )
+
+
+def _is_multiline_value(node: Node) -> bool:
+    """Check whether a value or directive contains a multiline block string."""
+    if isinstance(node, StringValueNode):
+        return bool(node.block) and "\n" in print_block_string(node.value)
+    if isinstance(node, ListValueNode):
+        return any(map(_is_multiline_value, node.values))
+    if isinstance(node, ObjectValueNode):
+        return any(_is_multiline_value(field.value) for field in node.fields)
+    if isinstance(node, DirectiveNode):
+        return any(_is_multiline_value(arg.value) for arg in node.arguments or ())
+    return False
+
+
+# Buffer based helpers
+
+
+def _join(
+    out: List[str],
+    nodes: Optional[Collection[Node]],
+    nl: str,
+    separator: str = "",
+    start: str = "",
+    end: str = "",
+) -> None:
+    """Print the given nodes separated by separator.
+
+    Nodes that are printed as empty strings are skipped. If anything has been
+    printed, then also add start and end around the nodes.
+    """
+    if nodes:
+        append, print_node = out.append, _print_node
+        if start:
+            append(start)
+        size = begin = len(out)
+        for node in nodes:
+            print_node(node, out, nl)
+            if len(out) != size:
+                append(separator)
+                size = len(out)
+        if size == begin:
+            if start:
+                out.pop()
+        elif end:
+            out[-1] = end
+        else:
+            out.pop()
+
+
+def _wrap(out: List[str], start: str, node: Optional[Node], nl: str) -> None:
+    """Print the given node, preceded by start.
+
+    If the node is None or printed as empty string, then nothing will be printed.
+    """
+    if node:
+        out.append(start)
+        size = len(out)
+        _print_node(node, out, nl)
+        if len(out) == size:
+            out.pop()
+
+
+def _block(
+    out: List[str],
+    nodes: Optional[Collection[Node]],
+    nl: str,
+    start: str = "{",
+    end: str = "}",
+) -> None:
+    """Print the given nodes inside a block.
+
+    Each node is printed on its own line, wrapped in an indented "{ }" block,
+    or in other brackets if specified as start and end. When printing compactly,
+    the nodes are only separated by spaces.
+    """
+    if nodes:
+        inner = _INDENTED_NL[nl]
+        append, print_node = out.append, _print_node
+        append(start)
+        begin = len(out)
+        for node in nodes:
+            append(inner)
+            size = len(out)
+            print_node(node, out, inner)
+            if len(out) == size:
+                out.pop()
+        if len(out) == begin:
+            out.pop()
+        else:
+            append(nl)
+            append(end)
+
+
+def _wrap_block(out: List[str], nodes: Optional[Collection[Node]], nl: str) -> None:
+    """Print the given nodes inside a block preceded by a space, if there are any."""
+    if nodes:
+        out.append(" ")
+        size = len(out)
+        _block(out, nodes, nl)
+        if len(out) == size:
+            out.pop()
+
+
+def _indent_into(out: List[str], string: str, nl: str) -> None:
+    """Add the given string, indenting all lines but the first as given by nl."""
+    if nl != "\n" and "\n" in string:
+        string = string.replace("\n", nl)
+    out.append(string)
+
+
+_PRINTERS: Dict[str, Printer] = {
+    "name": _p_name,
+    "document": _p_document,
+    "operation_definition": _p_operation_definition,
+    "variable_definition": _p_variable_definition,
+    "variable": _p_variable,
+    "selection_set": _p_selection_set,
+    "field": _p_field,
+    "argument": _p_name_value_pair,
+    "list_nullability_operator": _p_list_nullability_operator,
+    "non_null_assertion": _p_non_null_assertion,
+    "error_boundary": _p_error_boundary,
+    "fragment_spread": _p_fragment_spread,
+    "inline_fragment": _p_inline_fragment,
+    "fragment_definition": _p_fragment_definition,
+    "int_value": _p_raw_value,
+    "float_value": _p_raw_value,
+    "string_value": _p_string_value,
+    "boolean_value": _p_boolean_value,
+    "null_value": _p_null_value,
+    "enum_value": _p_raw_value,
+    "list_value": _p_list_value,
+    "object_value": _p_object_value,
+    "object_field": _p_name_value_pair,
+    "directive": _p_directive,
+    "named_type": _p_named_type,
+    "list_type": _p_list_type,
+    "non_null_type": _p_non_null_type,
+    "schema_definition": _p_schema_definition,
+    "operation_type_definition": _p_operation_type_definition,
+    "scalar_type_definition": _p_scalar_type_definition,
+    "object_type_definition": _p_object_type_definition,
+    "field_definition": _p_field_definition,
+    "input_value_definition": _p_input_value_definition,
+    "interface_type_definition": _p_interface_type_definition,
+    "union_type_definition": _p_union_type_definition,
+    "enum_type_definition": _p_enum_type_definition,
+    "enum_value_definition": _p_enum_value_definition,
+    "input_object_type_definition": _p_input_object_type_definition,
+    "directive_definition": _p_directive_definition,
+    "schema_extension": _p_schema_extension,
+    "scalar_type_extension": _p_scalar_type_extension,
+    "object_type_extension": _p_object_type_extension,
+    "interface_type_extension": _p_interface_type_extension,
+    "union_type_extension": _p_union_type_extension,
+    "enum_type_extension": _p_enum_type_extension,
+    "input_object_type_extension": _p_input_object_type_extension,
+}
 
 
 class PrintAstVisitor(Visitor):
+    """Visitor that prints an AST.
+
+    Note that :func:`print_ast` does not use this visitor any more, but prints the
+    AST directly. This class is only kept for backward compatibility.
+    """
+
     @staticmethod
     def leave_name(node: PrintedNode, *_args: Any) -> str:
         return node.value
@@ -419,7 +1284,7 @@ def join(strings: Optional[Strings], separator: str = "") -> str:
     Return an empty string if it is None or empty, otherwise join all items together
     separated by separator if provided.
     """
-    return separator.join(s for s in strings if s) if strings else ""
+    return separator.join(filter(None, strings)) if strings else ""
 
 
 def block(strings: Optional[Strings]) -> str:
@@ -446,7 +1311,7 @@ def indent(string: str) -> str:
     If the string is not None or empty, add two spaces at the beginning of every line
     inside the string.
     """
-    return wrap("  ", string.replace("\n", "\n  "))
+    return "  " + string.replace("\n", "\n  ") if string else ""
 
 
 def is_multiline(string: str) -> bool:
@@ -0,0 +1,17 @@
+from graphql import parse, print_ast
+
+from ..fixtures import big_schema_sdl, kitchen_sink_query  # noqa: F401
+
+
+def test_print_kitchen_sink(benchmark, kitchen_sink_query):  # noqa: F811
+    document_ast = parse(
+        kitchen_sink_query, experimental_client_controlled_nullability=True
+    )
+    printed = benchmark(lambda: print_ast(document_ast))
+    assert printed.startswith("query queryName(")
+
+
+def test_print_big_schema(benchmark, big_schema_sdl):  # noqa: F811
+    document_ast = parse(big_schema_sdl)
+    printed = benchmark(lambda: print_ast(document_ast))
+    assert printed.startswith('"""Autogenerated input type of AcceptTopicSuggestion"""')
@@ -1,4 +1,4 @@
-from operator import attrgetter
+from operator import itemgetter
 from typing import Callable
 
 from graphql.language import (
@@ -19,20 +19,20 @@ from graphql.language import (
 )
 
 
-all_ast_nodes = sorted(
-    [
-        node_type()
+all_ast_kinds_and_nodes = sorted(
+    (
+        (node_type.kind, node_type())
         for node_type in vars(ast).values()
         if type(node_type) is type
         and issubclass(node_type, Node)
         and not node_type.__name__.startswith("Const")
-    ],
-    key=attrgetter("kind"),
+    ),
+    key=itemgetter(0),
 )
 
 
 def filter_nodes(predicate: Callable[[Node], bool]):
-    return [node.kind for node in all_ast_nodes if predicate(node)]
+    return [kind for kind, node in all_ast_kinds_and_nodes if predicate(node)]
 
 
 def describe_ast_node_predicates():
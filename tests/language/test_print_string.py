@@ -1,4 +1,4 @@
-from graphql.language.print_string import print_string
+from graphql.language.print_string import escape_sequences, print_string
 
 
 def describe_print_string():
@@ -26,6 +26,10 @@ def describe_print_string():
     def does_not_escape_supplementary_character():
         assert print_string("\U0001f600") == '"\U0001f600"'
 
+    def escapes_every_single_char_needing_escape():
+        for code, escaped in escape_sequences.items():
+            assert print_string(f"a{chr(code)}b") == f'"a{escaped}b"'
+
     def escapes_all_control_chars():
         assert print_string(
             "\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0A\x0B\x0C\x0D\x0E\x0F"
@@ -1,8 +1,31 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from gc import collect
+from time import sleep
+from typing import List, cast
 
 from pytest import raises
 
-from graphql.language import FieldNode, NameNode, parse, print_ast
+from graphql.language import (
+    DocumentNode,
+    FieldNode,
+    NameNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    clear_print_cache,
+    hash_ast,
+    parse,
+    print_ast,
+    print_ast_cached,
+    print_ast_compact,
+    print_ast_into,
+    print_source,
+    printer,
+    visit,
+)
+from graphql.language.printer import PrintAstVisitor
 
 from ..fixtures import kitchen_sink_query  # noqa: F401
 from ..utils import dedent
@@ -13,6 +36,46 @@ def describe_printer_query_document():
         ast = FieldNode(name=NameNode(value="foo"))
         assert print_ast(ast) == "foo"
 
+    def prints_empty_document():
+        assert print_ast(DocumentNode(definitions=())) == ""
+
+    def prints_field_with_empty_selection_set():
+        ast = FieldNode(name=NameNode(value="foo"), selection_set=SelectionSetNode())
+        assert print_ast(ast) == "foo"
+
+    def skips_definitions_printed_as_empty_strings():
+        empty = OperationDefinitionNode(
+            operation=OperationType.QUERY, selection_set=SelectionSetNode()
+        )
+        operation = parse("{ a }").definitions[0]
+        ast = DocumentNode(definitions=(empty, operation))
+        assert print_ast(ast) == "{\n  a\n}"
+        ast = DocumentNode(definitions=(operation, empty, operation))
+        printed = print_ast(ast)
+        assert printed == "{\n  a\n}\n\n{\n  a\n}"
+        assert visit(ast, PrintAstVisitor()) == printed
+        assert print_ast_compact(ast) == "{ a } { a }"
+        ast = DocumentNode(definitions=(empty, empty))
+        assert print_ast(ast) == ""
+
+    def skips_selections_printed_as_empty_strings():
+        ast = parse("{ a { b c } }")
+        field = cast(
+            FieldNode,
+            cast(OperationDefinitionNode, ast.definitions[0]).selection_set.selections[
+                0
+            ],
+        )
+        selections = cast(SelectionSetNode, field.selection_set).selections
+        cast(FieldNode, selections[0]).name.value = ""
+        printed = print_ast(ast)
+        assert printed == "{\n  a {\n    c\n  }\n}"
+        assert visit(ast, PrintAstVisitor()) == printed
+        cast(FieldNode, selections[1]).name.value = ""
+        printed = print_ast(ast)
+        assert printed == "{\n  a\n}"
+        assert visit(ast, PrintAstVisitor()) == printed
+
     def produces_helpful_error_messages():
         bad_ast = {"random": "Data"}
         with raises(TypeError) as exc_info:
@@ -28,6 +91,20 @@ def describe_printer_query_document():
         query_ast_shorthanded = parse("query { id, name }")
         assert print_ast(query_ast_shorthanded) == "{\n  id\n  name\n}"
 
+    def prints_query_operation_with_empty_name_in_short_form():
+        ast = parse("query Q { a }")
+        operation = cast(OperationDefinitionNode, ast.definitions[0])
+        operation.name = NameNode(value="")
+        printed = print_ast(ast)
+        assert printed == "{\n  a\n}"
+        assert visit(ast, PrintAstVisitor()) == printed
+        ast = parse("query Q($v: Int) { a }")
+        operation = cast(OperationDefinitionNode, ast.definitions[0])
+        operation.name = NameNode(value="")
+        printed = print_ast(ast)
+        assert printed == "query ($v: Int) {\n  a\n}"
+        assert visit(ast, PrintAstVisitor()) == printed
+
     def correctly_prints_mutation_operation_without_name():
         mutation_ast = parse("mutation { id, name }")
         assert print_ast(mutation_ast) == "mutation {\n  id\n  name\n}"
@@ -107,6 +184,30 @@ def describe_printer_query_document():
             """
         )
 
+    def does_not_count_indentation_of_block_strings_as_line_length():
+        printed = print_ast(
+            parse(
+                '{ a { b { field(arg: """\nline one\nline two\nline three\n""",'
+                ' other: "12345678901234567890") } } }'
+            )
+        )
+
+        assert printed == dedent(
+            '''
+            {
+              a {
+                b {
+                  field(arg: """
+                  line one
+                  line two
+                  line three
+                  """, other: "12345678901234567890")
+                }
+              }
+            }
+            '''
+        )
+
     def legacy_prints_fragment_with_variable_directives():
         query_ast_with_variable_directive = parse(
             "fragment Foo($foo: TestType @test) on TestType @testDirective { id }",
@@ -221,3 +322,230 @@ def describe_printer_query_document():
             }
             '''  # noqa: E501
         )
+
+    def prints_kitchen_sink_like_legacy_visitor(kitchen_sink_query):  # noqa: F811
+        ast = parse(kitchen_sink_query, experimental_client_controlled_nullability=True)
+        assert visit(ast, PrintAstVisitor()) == print_ast(ast)
+
+
+def describe_printer_into_list():
+    def appends_to_given_list():
+        out = ["# first", "\n"]
+        print_ast_into(parse("{ id, name }"), out)
+        out.append("\n# second\n")
+        print_ast_into(parse("mutation { like }"), out)
+        assert (
+            "".join(out)
+            == dedent(
+                """
+            # first
+            {
+              id
+              name
+            }
+            # second
+            mutation {
+              like
+            }
+            """
+            ).rstrip()
+        )
+
+    def produces_helpful_error_messages():
+        bad_ast = {"random": "Data"}
+        with raises(TypeError) as exc_info:
+            # noinspection PyTypeChecker
+            print_ast_into(bad_ast, [])  # type: ignore
+        assert str(exc_info.value) == "Not an AST Node: {'random': 'Data'}."
+
+    def prints_kitchen_sink_like_print_ast(kitchen_sink_query):  # noqa: F811
+        ast = parse(kitchen_sink_query, experimental_client_controlled_nullability=True)
+        out: List[str] = []
+        print_ast_into(ast, out)
+        assert "".join(out) == print_ast(ast)
+
+
+def describe_compact_printer_query_document():
+    def prints_minimal_ast():
+        ast = FieldNode(name=NameNode(value="foo"))
+        assert print_ast_compact(ast) == "foo"
+
+    def produces_helpful_error_messages():
+        bad_ast = {"random": "Data"}
+        with raises(TypeError) as exc_info:
+            # noinspection PyTypeChecker
+            print_ast_compact(bad_ast)  # type: ignore
+        assert str(exc_info.value) == "Not an AST Node: {'random': 'Data'}."
+
+    def prints_operations_on_a_single_line():
+        ast = parse("query ($foo: TestType) @testDirective { id, name { first } }")
+        assert print_ast_compact(ast) == (
+            "query ($foo: TestType) @testDirective { id name { first } }"
+        )
+        assert print_ast_compact(parse("{ a } { b }")) == "{ a } { b }"
+
+    def keeps_arguments_on_one_line_if_line_has_more_than_80_chars():
+        printed = print_ast_compact(
+            parse(
+                "{trip(wheelchair:false arriveBy:false includePlannedCancellations:true"
+                " transitDistanceReluctance:2000){dateTime}}"
+            )
+        )
+        assert printed == (
+            "{ trip(wheelchair: false, arriveBy: false,"
+            " includePlannedCancellations: true, transitDistanceReluctance: 2000)"
+            " { dateTime } }"
+        )
+
+    def prints_block_strings_as_regular_strings():
+        ast = parse('{ field(arg: """\n  multi\n  line\n""") }')
+        assert print_ast_compact(ast) == '{ field(arg: "multi\\nline") }'
+
+    def prints_kitchen_sink_as_equivalent_document(
+        kitchen_sink_query,  # noqa: F811
+    ):
+        ast = parse(kitchen_sink_query, experimental_client_controlled_nullability=True)
+        printed = print_ast_compact(ast)
+        assert "\n" not in printed
+        printed_ast = parse(printed, experimental_client_controlled_nullability=True)
+        assert print_ast_compact(printed_ast) == printed
+
+
+def describe_printer_cache():
+    def caches_printed_documents():
+        clear_print_cache()
+        ast = parse("{ id, name }")
+        printed = print_ast_cached(ast)
+        assert printed == "{\n  id\n  name\n}"
+        assert print_ast_cached(ast) is printed
+        assert print_ast_cached(parse("{ id, name }")) is not printed
+        clear_print_cache()
+        assert print_ast_cached(ast) == printed
+        assert print_ast_cached(ast) is not printed
+
+    def does_not_cache_other_nodes():
+        clear_print_cache()
+        ast = parse("{ id, name }").definitions[0]
+        assert print_ast_cached(ast) == "{\n  id\n  name\n}"
+        assert not printer._print_cache
+
+    def does_not_cache_with_print_ast():
+        clear_print_cache()
+        ast = parse("query A { a }")
+        assert print_ast(ast) == "query A {\n  a\n}"
+        assert not printer._print_cache
+        operation = cast(OperationDefinitionNode, ast.definitions[0])
+        operation.name = NameNode(value="B")
+        field = cast(FieldNode, operation.selection_set.selections[0])
+        field.name = NameNode(value="b")
+        assert print_ast(ast) == "query B {\n  b\n}"
+
+    def does_not_keep_printed_documents_alive():
+        clear_print_cache()
+        ast = parse("{ id }")
+        print_ast_cached(ast)
+        assert len(printer._print_cache) == 1
+        del ast
+        collect()
+        assert not printer._print_cache
+
+    def produces_helpful_error_messages():
+        bad_ast = {"random": "Data"}
+        with raises(TypeError) as exc_info:
+            # noinspection PyTypeChecker
+            print_ast_cached(bad_ast)  # type: ignore
+        assert str(exc_info.value) == "Not an AST Node: {'random': 'Data'}."
+
+    def evicts_least_recently_printed_documents(monkeypatch):
+        clear_print_cache()
+        monkeypatch.setattr(printer, "MAX_CACHED_DOCUMENTS", 2)
+        asts = [parse(f"{{ field{i} }}") for i in range(3)]
+        printed = [print_ast_cached(ast) for ast in asts[:2]]
+        assert print_ast_cached(asts[0]) is printed[0]
+        print_ast_cached(asts[2])
+        assert len(printer._print_cache) == 2
+        assert print_ast_cached(asts[0]) is printed[0]
+        assert print_ast_cached(asts[1]) is not printed[1]
+
+    def can_be_used_from_multiple_threads(monkeypatch):
+        class SlowCache(OrderedDict):
+            def get(self, key, default=None):
+                value = super().get(key, default)
+                sleep(0.001)  # give other threads a chance to modify the cache
+                return value
+
+        monkeypatch.setattr(printer, "_print_cache", SlowCache())
+        monkeypatch.setattr(printer, "MAX_CACHED_DOCUMENTS", 2)
+        asts = [parse(f"{{ field{i} }}") for i in range(3)]
+
+        def print_repeatedly(ast: DocumentNode) -> List[str]:
+            return [print_ast_cached(ast) for _iteration in range(20)]
+
+        with ThreadPoolExecutor(6) as executor:
+            futures = [
+                executor.submit(print_repeatedly, asts[thread % 3])
+                for thread in range(6)
+            ]
+            for thread, future in enumerate(futures):
+                assert future.result() == [print_ast(asts[thread % 3])] * 20
+
+
+def describe_hash_ast():
+    def returns_a_16_byte_digest():
+        digest = hash_ast(parse("{ id }"))
+        assert isinstance(digest, bytes)
+        assert len(digest) == 16
+
+    def ignores_formatting_and_locations():
+        digest = hash_ast(parse("query Q($a: Int) { id, name(a: $a) }"))
+        assert (
+            hash_ast(
+                parse(
+                    """
+                    query Q(
+                      $a: Int
+                    ) {
+                      id
+                      name(a: $a)
+                    }
+                    """,
+                    no_location=True,
+                )
+            )
+            == digest
+        )
+        assert hash_ast(parse('{ f(a: """x""") }')) == hash_ast(parse('{ f(a: "x") }'))
+
+    def distinguishes_different_documents():
+        assert hash_ast(parse("{ id }")) != hash_ast(parse("{ name }"))
+        assert hash_ast(parse('{ f(a: "x") }')) != hash_ast(parse('{ f(a: "y") }'))
+
+    def produces_helpful_error_messages():
+        bad_ast = {"random": "Data"}
+        with raises(TypeError) as exc_info:
+            # noinspection PyTypeChecker
+            hash_ast(bad_ast)  # type: ignore
+        assert str(exc_info.value) == "Not an AST Node: {'random': 'Data'}."
+
+
+def describe_print_source():
+    def returns_the_source_text_of_a_document():
+        source = "# comment\nquery Q { id, name }\n"
+        assert print_source(parse(source)) == source
+
+    def returns_the_source_text_of_a_sub_node():
+        ast = parse("query Q { field(arg: [1, 2]) { id } }")
+        field = ast.definitions[0].selection_set.selections[0]  # type: ignore
+        assert print_source(field) == "field(arg: [1, 2]) { id }"
+        assert print_source(field.arguments[0].value) == "[1, 2]"
+
+    def prints_ast_without_location():
+        ast = parse("query Q { id, name }", no_location=True)
+        assert print_source(ast) == print_ast(ast)
+
+    def produces_helpful_error_messages():
+        bad_ast = {"random": "Data"}
+        with raises(TypeError) as exc_info:
+            # noinspection PyTypeChecker
+            print_source(bad_ast)  # type: ignore
+        assert str(exc_info.value) == "Not an AST Node: {'random': 'Data'}."
@@ -1,8 +1,19 @@
 from copy import deepcopy
+from typing import cast
 
 from pytest import raises
 
-from graphql.language import NameNode, ScalarTypeDefinitionNode, parse, print_ast
+from graphql.language import (
+    EnumTypeDefinitionNode,
+    NameNode,
+    ScalarTypeDefinitionNode,
+    UnionTypeDefinitionNode,
+    parse,
+    print_ast,
+    print_ast_compact,
+    visit,
+)
+from graphql.language.printer import PrintAstVisitor
 
 from ..fixtures import kitchen_sink_sdl  # noqa: F401
 from ..utils import dedent
@@ -21,6 +32,122 @@ def describe_printer_sdl_document():
         msg = str(exc_info.value)
         assert msg == "Not an AST Node: {'random': 'Data'}."
 
+    def prints_descriptions_of_all_definitions():
+        sdl = dedent(
+            """
+            "Scalar description"
+            scalar Foo
+
+            "Interface description"
+            interface Bar {
+              one: Type
+            }
+
+            "Union description"
+            union Feed = Story | Article
+
+            "Enum description"
+            enum Site {
+              "Value description"
+              DESKTOP
+            }
+
+            "Input description"
+            input InputType {
+              "Field description"
+              key: String!
+            }
+
+            "Directive description"
+            directive @skip(
+              "Argument description"
+              if: Boolean!
+            ) on FIELD
+
+            "Directive without arguments"
+            directive @foo on FIELD
+            """
+        )
+        assert print_ast(parse(sdl)) == sdl
+
+    def puts_arguments_with_multiline_block_strings_on_separate_lines():
+        ast = parse(
+            '''
+            type Query {
+              field(arg: String = """
+              multiline
+              default
+              """, other: Int): String
+            }
+            '''
+        )
+        assert print_ast(ast) == dedent(
+            '''
+            type Query {
+              field(
+                arg: String = """
+                multiline
+                default
+                """
+                other: Int
+              ): String
+            }
+            '''
+        )
+
+    def puts_arguments_with_nested_multiline_block_strings_on_separate_lines():
+        ast = parse(
+            '''
+            type Query {
+              field(arg: [In] = [{a: """
+              multiline
+              value
+              """}], other: Int): String
+              other(arg: Int @deprecated(reason: """
+              multiline
+              reason
+              """)): String
+            }
+            '''
+        )
+        assert print_ast(ast) == dedent(
+            '''
+            type Query {
+              field(
+                arg: [In] = [{ a: """
+                multiline
+                value
+                """ }]
+                other: Int
+              ): String
+              other(
+                arg: Int @deprecated(reason: """
+                multiline
+                reason
+                """)
+              ): String
+            }
+            '''
+        )
+
+    def keeps_arguments_with_single_line_block_strings_on_one_line():
+        ast = parse(
+            '''
+            type Query {
+              field(arg: String = """default""", other: Int = 1): String
+              other(arg: [In] = [{ a: 1 }, { b: [null] }] @deprecated): String
+            }
+            '''
+        )
+        assert print_ast(ast) == dedent(
+            '''
+            type Query {
+              field(arg: String = """default""", other: Int = 1): String
+              other(arg: [In] = [{ a: 1 }, { b: [null] }] @deprecated): String
+            }
+            '''
+        )
+
     # noinspection PyShadowingNames
     def prints_kitchen_sink_without_altering_ast(kitchen_sink_sdl):  # noqa: F811
         ast = parse(kitchen_sink_sdl, no_location=True)
@@ -171,3 +298,65 @@ def describe_printer_sdl_document():
             }
             '''  # noqa: E501
         )
+
+    # noinspection PyShadowingNames
+    def prints_kitchen_sink_like_legacy_visitor(kitchen_sink_sdl):  # noqa: F811
+        ast = parse(kitchen_sink_sdl)
+        assert visit(ast, PrintAstVisitor()) == print_ast(ast)
+
+    def skips_items_printed_as_empty_strings():
+        ast = parse("union U = A | B | C enum E { A B }")
+        union = cast(UnionTypeDefinitionNode, ast.definitions[0])
+        enum = cast(EnumTypeDefinitionNode, ast.definitions[1])
+        union.types[1].name.value = ""
+        enum.values[0].name.value = ""
+        printed = print_ast(ast)
+        assert printed == "union U = A | C\n\nenum E {\n  B\n}"
+        assert visit(ast, PrintAstVisitor()) == printed
+        for type_ in union.types:
+            type_.name.value = ""
+        enum.values[1].name.value = ""
+        printed = print_ast(ast)
+        assert printed == "union U\n\nenum E"
+        assert visit(ast, PrintAstVisitor()) == printed
+
+
+def describe_compact_printer_sdl_document():
+    def prints_minimal_ast():
+        node = ScalarTypeDefinitionNode(name=NameNode(value="foo"))
+        assert print_ast_compact(node) == "scalar foo"
+
+    def prints_definitions_on_a_single_line():
+        ast = parse(
+            '''
+            """
+            Type
+            description
+            """
+            type Foo implements Bar & Baz {
+              "Field description"
+              one(
+                """Argument description"""
+                argument: InputType!
+              ): Type
+              two(argument: String = "string"): String @deprecated
+            }
+
+            enum Site { DESKTOP MOBILE }
+
+            directive @skip(if: Boolean!) on FIELD | FRAGMENT_SPREAD
+            '''
+        )
+        assert print_ast_compact(ast) == (
+            '"Type\\ndescription" type Foo implements Bar & Baz {'
+            ' "Field description" one("Argument description" argument: InputType!):'
+            ' Type two(argument: String = "string"): String @deprecated }'
+            " enum Site { DESKTOP MOBILE }"
+            " directive @skip(if: Boolean!) on FIELD | FRAGMENT_SPREAD"
+        )
+
+    # noinspection PyShadowingNames
+    def prints_kitchen_sink_as_equivalent_document(kitchen_sink_sdl):  # noqa: F811
+        printed = print_ast_compact(parse(kitchen_sink_sdl))
+        assert "\n" not in printed
+        assert print_ast_compact(parse(printed)) == printed
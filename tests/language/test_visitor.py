@@ -88,6 +88,12 @@ def describe_visitor():
             visit("invalid", Visitor())  # type: ignore
         assert str(exc_info.value) == "Not an AST Node: 'invalid'."
 
+    def visit_with_invalid_child_node():
+        ast = FieldNode(name="invalid")
+        with raises(TypeError) as exc_info:
+            visit(ast, Visitor())
+        assert str(exc_info.value) == "Invalid AST Node: 'invalid'."
+
     def visit_with_invalid_visitor():
         ast = parse("{ a }", no_location=True)
 